@@ -6,6 +6,14 @@ import os
 from aiorun import run
 from music_assistant.mass import MusicAssistant
 
+try:
+    import uvloop  # noqa # pylint: disable=unused-import
+
+    USE_UVLOOP = True
+except ImportError:
+    # uvloop is optional and not available on all platforms (e.g. Windows)
+    USE_UVLOOP = False
+
 
 def get_arguments():
     """Arguments handling."""
@@ -72,7 +80,7 @@ def main():
 
     run(
         mass.start(),
-        use_uvloop=True,
+        use_uvloop=USE_UVLOOP,
         shutdown_callback=on_shutdown,
         executor_workers=64,
     )
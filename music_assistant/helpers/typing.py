@@ -12,6 +12,7 @@ if TYPE_CHECKING:
     from music_assistant.models.streamdetails import StreamDetails
     from music_assistant.models.player import Player
     from music_assistant.managers.config import ConfigSubItem
+    from music_assistant.managers.players import PlayerManager
 
 else:
     MusicAssistant = "MusicAssistant"
@@ -20,6 +21,7 @@ else:
     StreamDetails = "StreamDetails"
     Player = "Player"
     ConfigSubItem = "ConfigSubItem"
+    PlayerManager = "PlayerManager"
 
 
 QueueItems = Set[QueueItem]
@@ -1,11 +1,17 @@
 """Various helpers for web requests."""
 
+import gzip
 import inspect
 import ipaddress
-from functools import wraps
-from typing import Any, Callable, Union
-
-import ujson
+import logging
+import os
+import shutil
+import tempfile
+from contextlib import suppress
+from functools import lru_cache, wraps
+from typing import Any, Callable, Dict, Tuple, Union
+
+import orjson
 from aiohttp import web
 
 try:
@@ -15,6 +21,12 @@ except ImportError:
     # python 3.7
     from typing_inspect import get_args, get_origin
 
+LOGGER = logging.getLogger("web")
+
+PRECOMPRESS_EXTENSIONS = (".js", ".css", ".html", ".svg", ".json")
+MAX_PAGE_SIZE = 500
+RESPONSE_PREPARED = "response_prepared"
+
 
 def require_local_subnet(func):
     """Return decorator to specify web method as available locally only."""
@@ -39,36 +51,123 @@ def require_local_subnet(func):
     return wrapped
 
 
-def serialize_values(obj):
-    """Recursively create serializable values for (custom) data types."""
-
-    def get_val(val):
-        if hasattr(val, "to_dict"):
-            return val.to_dict()
-        if isinstance(val, (list, set, filter, tuple)):
-            return [get_val(x) for x in val]
-        if val.__class__ == "dict_valueiterator":
-            return [get_val(x) for x in val]
-        if isinstance(val, dict):
-            return {key: get_val(value) for key, value in val.items()}
-        return val
-
-    return get_val(obj)
+async def mark_response_prepared(request: web.Request, response: web.StreamResponse):
+    """Mark request as answered once its response (headers) got sent."""
+    request[RESPONSE_PREPARED] = True
+
+
+@web.middleware
+async def error_middleware(request: web.Request, handler: Callable):
+    """Return a bad request/not found response for invalid input."""
+    try:
+        return await handler(request)
+    except IndexError:
+        # most likely a bug, let aiohttp handle (and log) it as internal error
+        raise
+    except (LookupError, ValueError) as exc:
+        if request.get(RESPONSE_PREPARED):
+            # (streaming) response already started, can't send an error status
+            raise
+        LOGGER.debug("Invalid request %s", request.path, exc_info=exc)
+        if isinstance(exc, (KeyError, ValueError)):
+            raise web.HTTPBadRequest() from exc
+        raise web.HTTPNotFound() from exc
+
+
+# encoder for (custom) data types, resolved once per type
+_ENCODERS: Dict[type, Callable] = {
+    set: list,
+    frozenset: list,
+    filter: list,
+    type({}.values()): list,
+}
+
+
+def _default(obj: Any) -> Any:
+    """Convert (custom) data types that orjson can not handle natively."""
+    obj_type = type(obj)
+    encoder = _ENCODERS.get(obj_type)
+    if encoder is None:
+        encoder = getattr(obj_type, "to_dict", None)
+        if encoder is None and isinstance(obj, (set, frozenset)):
+            encoder = list
+        if encoder is None:
+            raise TypeError
+        _ENCODERS[obj_type] = encoder
+    return encoder(obj)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialize (custom) data types to json (utf-8 encoded bytes)."""
+    return orjson.dumps(
+        obj,
+        default=_default,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS,
+    )
 
 
-def json_serializer(obj):
+def json_serializer(obj: Any) -> str:
     """Json serializer to recursively create serializable values for custom data types."""
-    return ujson.dumps(serialize_values(obj))
-    # return ujson.dumps(obj)
+    return json_dumps(obj).decode()
 
 
-def json_response(data: Any, status: int = 200):
+def json_response(data: Any, status: int = 200) -> web.Response:
     """Return json in web request."""
     return web.Response(
-        body=json_serializer(data), status=200, content_type="application/json"
+        body=json_dumps(data), status=status, content_type="application/json"
     )
 
 
+def precompress_static_files(static_dir: str) -> None:
+    """
+    Create gzip compressed versions of all (text based) static files in a directory.
+
+    The aiohttp FileResponse serves the .gz file if the client accepts gzip encoding.
+    """
+    for dir_path, _, filenames in os.walk(static_dir):
+        for filename in filenames:
+            if not filename.endswith(PRECOMPRESS_EXTENSIONS):
+                continue
+            file_path = os.path.join(dir_path, filename)
+            gz_path = file_path + ".gz"
+            if os.path.isfile(gz_path) and os.path.getmtime(
+                gz_path
+            ) >= os.path.getmtime(file_path):
+                continue
+            tmp_path = None
+            try:
+                # write to a temp file first and swap it in when complete,
+                # so a half written .gz file is never served
+                with open(file_path, "rb") as src_file, tempfile.NamedTemporaryFile(
+                    dir=dir_path, prefix=f".{filename}.", suffix=".tmp", delete=False
+                ) as tmp_file:
+                    tmp_path = tmp_file.name
+                    with gzip.GzipFile(
+                        filename=filename, mode="wb", compresslevel=9, fileobj=tmp_file
+                    ) as gz_file:
+                        shutil.copyfileobj(src_file, gz_file)
+                os.replace(tmp_path, gz_path)
+            except OSError:
+                # static dir is not writable, files will be served uncompressed
+                if tmp_path:
+                    with suppress(OSError):
+                        os.remove(tmp_path)
+                return
+
+
+def parse_paging(
+    offset: Any, limit: Any, max_limit: int = MAX_PAGE_SIZE
+) -> Tuple[int, int]:
+    """
+    Parse offset and limit arguments for paged api results into sane values.
+
+    Raises ValueError on non-numeric input so the caller gets a proper error.
+    """
+    offset = max(int(offset), 0)
+    limit = min(max(int(limit), 1), max_limit)
+    return offset, limit
+
+
 def api_route(ws_cmd_path, ws_require_auth=True):
     """Decorate a function as websocket command."""
 
@@ -80,6 +179,7 @@ def api_route(ws_cmd_path, ws_require_auth=True):
     return decorate
 
 
+@lru_cache(maxsize=256)
 def get_typed_signature(call: Callable) -> inspect.Signature:
     """Parse signature of function to do type vaildation and/or api spec generation."""
     signature = inspect.signature(call)
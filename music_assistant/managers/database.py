@@ -162,37 +162,61 @@ class DatabaseManager:
             result.radios = await self.get_radios(sql_query)
         return result
 
-    async def get_library_artists(self, orderby: str = "name") -> List[Artist]:
+    async def get_library_artists(
+        self, orderby: str = "name", limit: int = 0, offset: int = 0
+    ) -> List[Artist]:
         """Get all library artists."""
         sql_query = "WHERE in_library = 1"
-        return await self.get_artists(sql_query, orderby=orderby)
+        return await self.get_artists(
+            sql_query, orderby=orderby, limit=limit, offset=offset
+        )
 
-    async def get_library_albums(self, orderby: str = "name") -> List[Album]:
+    async def get_library_albums(
+        self, orderby: str = "name", limit: int = 0, offset: int = 0
+    ) -> List[Album]:
         """Get all library albums."""
         sql_query = "WHERE in_library = 1"
-        return await self.get_albums(sql_query, orderby=orderby)
+        return await self.get_albums(
+            sql_query, orderby=orderby, limit=limit, offset=offset
+        )
 
-    async def get_library_tracks(self, orderby: str = "name") -> List[Track]:
+    async def get_library_tracks(
+        self, orderby: str = "name", limit: int = 0, offset: int = 0
+    ) -> List[Track]:
         """Get all library tracks."""
         sql_query = "WHERE in_library = 1"
-        return await self.get_tracks(sql_query, orderby=orderby)
+        return await self.get_tracks(
+            sql_query, orderby=orderby, limit=limit, offset=offset
+        )
 
-    async def get_library_playlists(self, orderby: str = "name") -> List[Playlist]:
+    async def get_library_playlists(
+        self, orderby: str = "name", limit: int = 0, offset: int = 0
+    ) -> List[Playlist]:
         """Fetch all playlist records from table."""
         sql_query = "WHERE in_library = 1"
-        return await self.get_playlists(sql_query, orderby=orderby)
+        return await self.get_playlists(
+            sql_query, orderby=orderby, limit=limit, offset=offset
+        )
 
     async def get_library_radios(
-        self, provider_id: str = None, orderby: str = "name"
+        self,
+        provider_id: str = None,
+        orderby: str = "name",
+        limit: int = 0,
+        offset: int = 0,
     ) -> List[Radio]:
         """Fetch all radio records from table."""
         sql_query = "WHERE in_library = 1"
-        return await self.get_radios(sql_query, orderby=orderby)
+        return await self.get_radios(
+            sql_query, orderby=orderby, limit=limit, offset=offset
+        )
 
     async def get_playlists(
         self,
         filter_query: str = None,
         orderby: str = "name",
+        limit: int = 0,
+        offset: int = 0,
     ) -> List[Playlist]:
         """Get all playlists from database."""
         async with aiosqlite.connect(self._dbfile, timeout=120) as db_conn:
@@ -201,6 +225,9 @@ class DatabaseManager:
             if filter_query:
                 sql_query += " " + filter_query
             sql_query += " ORDER BY %s" % orderby
+            if limit or offset:
+                # sqlite needs a LIMIT clause for OFFSET, -1 means no limit
+                sql_query += " LIMIT %d OFFSET %d" % (limit or -1, offset)
             return [
                 Playlist.from_db_row(db_row)
                 for db_row in await db_conn.execute_fetchall(sql_query, ())
@@ -217,6 +244,8 @@ class DatabaseManager:
         self,
         filter_query: str = None,
         orderby: str = "name",
+        limit: int = 0,
+        offset: int = 0,
         db_conn: aiosqlite.Connection = None,
     ) -> List[Radio]:
         """Fetch radio records from database."""
@@ -224,6 +253,9 @@ class DatabaseManager:
         if filter_query:
             sql_query += " " + filter_query
         sql_query += " ORDER BY %s" % orderby
+        if limit or offset:
+            # sqlite needs a LIMIT clause for OFFSET, -1 means no limit
+            sql_query += " LIMIT %d OFFSET %d" % (limit or -1, offset)
         async with aiosqlite.connect(self._dbfile, timeout=120) as db_conn:
             db_conn.row_factory = aiosqlite.Row
             return [
@@ -419,6 +451,8 @@ class DatabaseManager:
         self,
         filter_query: str = None,
         orderby: str = "name",
+        limit: int = 0,
+        offset: int = 0,
         db_conn: aiosqlite.Connection = None,
     ) -> List[Artist]:
         """Fetch artist records from database."""
@@ -426,6 +460,9 @@ class DatabaseManager:
         if filter_query:
             sql_query += " " + filter_query
         sql_query += " ORDER BY %s" % orderby
+        if limit or offset:
+            # sqlite needs a LIMIT clause for OFFSET, -1 means no limit
+            sql_query += " LIMIT %d OFFSET %d" % (limit or -1, offset)
         async with aiosqlite.connect(self._dbfile, timeout=120) as db_conn:
             db_conn.row_factory = aiosqlite.Row
             return [
@@ -516,6 +553,8 @@ class DatabaseManager:
         self,
         filter_query: str = None,
         orderby: str = "name",
+        limit: int = 0,
+        offset: int = 0,
         db_conn: aiosqlite.Connection = None,
     ) -> List[Album]:
         """Fetch all album records from the database."""
@@ -523,6 +562,9 @@ class DatabaseManager:
         if filter_query:
             sql_query += " " + filter_query
         sql_query += " ORDER BY %s" % orderby
+        if limit or offset:
+            # sqlite needs a LIMIT clause for OFFSET, -1 means no limit
+            sql_query += " LIMIT %d OFFSET %d" % (limit or -1, offset)
         async with aiosqlite.connect(self._dbfile, timeout=120) as db_conn:
             db_conn.row_factory = aiosqlite.Row
             return [
@@ -670,6 +712,8 @@ class DatabaseManager:
         self,
         filter_query: str = None,
         orderby: str = "name",
+        limit: int = 0,
+        offset: int = 0,
         db_conn: aiosqlite.Connection = None,
     ) -> List[Track]:
         """Return all track records from the database."""
@@ -677,6 +721,9 @@ class DatabaseManager:
         if filter_query:
             sql_query += " " + filter_query
         sql_query += " ORDER BY %s" % orderby
+        if limit or offset:
+            # sqlite needs a LIMIT clause for OFFSET, -1 means no limit
+            sql_query += " LIMIT %d OFFSET %d" % (limit or -1, offset)
         async with aiosqlite.connect(self._dbfile, timeout=120) as db_conn:
             db_conn.row_factory = aiosqlite.Row
             return [
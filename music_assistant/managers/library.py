@@ -7,7 +7,7 @@ from typing import Any, List
 
 from music_assistant.constants import EVENT_MUSIC_SYNC_STATUS, EVENT_PROVIDER_REGISTERED
 from music_assistant.helpers.util import callback, run_periodic
-from music_assistant.helpers.web import api_route
+from music_assistant.helpers.web import api_route, parse_paging
 from music_assistant.models.media_types import (
     Album,
     Artist,
@@ -82,29 +82,59 @@ class LibraryManager:
     ################ GET MediaItems that are added in the library ################
 
     @api_route("library/artists")
-    async def get_library_artists(self, orderby: str = "name") -> List[Artist]:
+    async def get_library_artists(
+        self, orderby: str = "name", limit: int = 0, offset: int = 0
+    ) -> List[Artist]:
         """Return all library artists, optionally filtered by provider."""
-        return await self.mass.database.get_library_artists(orderby=orderby)
+        if limit:
+            offset, limit = parse_paging(offset, limit)
+        return await self.mass.database.get_library_artists(
+            orderby=orderby, limit=limit, offset=offset
+        )
 
     @api_route("library/albums")
-    async def get_library_albums(self, orderby: str = "name") -> List[Album]:
+    async def get_library_albums(
+        self, orderby: str = "name", limit: int = 0, offset: int = 0
+    ) -> List[Album]:
         """Return all library albums, optionally filtered by provider."""
-        return await self.mass.database.get_library_albums(orderby=orderby)
+        if limit:
+            offset, limit = parse_paging(offset, limit)
+        return await self.mass.database.get_library_albums(
+            orderby=orderby, limit=limit, offset=offset
+        )
 
     @api_route("library/tracks")
-    async def get_library_tracks(self, orderby: str = "name") -> List[Track]:
+    async def get_library_tracks(
+        self, orderby: str = "name", limit: int = 0, offset: int = 0
+    ) -> List[Track]:
         """Return all library tracks, optionally filtered by provider."""
-        return await self.mass.database.get_library_tracks(orderby=orderby)
+        if limit:
+            offset, limit = parse_paging(offset, limit)
+        return await self.mass.database.get_library_tracks(
+            orderby=orderby, limit=limit, offset=offset
+        )
 
     @api_route("library/playlists")
-    async def get_library_playlists(self, orderby: str = "name") -> List[Playlist]:
+    async def get_library_playlists(
+        self, orderby: str = "name", limit: int = 0, offset: int = 0
+    ) -> List[Playlist]:
         """Return all library playlists, optionally filtered by provider."""
-        return await self.mass.database.get_library_playlists(orderby=orderby)
+        if limit:
+            offset, limit = parse_paging(offset, limit)
+        return await self.mass.database.get_library_playlists(
+            orderby=orderby, limit=limit, offset=offset
+        )
 
     @api_route("library/radios")
-    async def get_library_radios(self, orderby: str = "name") -> List[Playlist]:
+    async def get_library_radios(
+        self, orderby: str = "name", limit: int = 0, offset: int = 0
+    ) -> List[Playlist]:
         """Return all library radios, optionally filtered by provider."""
-        return await self.mass.database.get_library_radios(orderby=orderby)
+        if limit:
+            offset, limit = parse_paging(offset, limit)
+        return await self.mass.database.get_library_radios(
+            orderby=orderby, limit=limit, offset=offset
+        )
 
     async def get_library_playlist_by_name(self, name: str) -> Playlist:
         """Get in-library playlist by name."""
@@ -511,10 +511,12 @@ class MusicManager:
         provider_ids = ["database"] + [
             item.id for item in self.mass.get_providers(ProviderType.MUSIC_PROVIDER)
         ]
-        for provider_id in provider_ids:
-            provider_result = await self.search_provider(
-                search_query, provider_id, media_types, limit
-            )
+        for provider_result in await asyncio.gather(
+            *[
+                self.search_provider(search_query, provider_id, media_types, limit)
+                for provider_id in provider_ids
+            ]
+        ):
             result.artists += provider_result.artists
             result.albums += provider_result.albums
             result.tracks += provider_result.tracks
@@ -12,7 +12,7 @@ from music_assistant.constants import (
 )
 from music_assistant.helpers.typing import MusicAssistant
 from music_assistant.helpers.util import callback, try_parse_int
-from music_assistant.helpers.web import api_route
+from music_assistant.helpers.web import api_route, parse_paging
 from music_assistant.models.media_types import MediaItem, MediaType
 from music_assistant.models.player import (
     PlaybackState,
@@ -133,10 +133,16 @@ class PlayerManager:
 
     @callback
     @api_route("players/:queue_id/queue/items")
-    def get_player_queue_items(self, queue_id: str) -> Set[QueueItem]:
-        """Return player's queueitems by player_id."""
+    def get_player_queue_items(
+        self, queue_id: str, offset: int = 0, limit: int = 0
+    ) -> List[QueueItem]:
+        """Return (a page of) player's queueitems by player_id."""
         player_queue = self.get_player_queue(queue_id)
-        return player_queue.items if player_queue else {}
+        if not player_queue:
+            return []
+        if limit:
+            offset, limit = parse_paging(offset, limit)
+        return player_queue.get_items(offset, limit)
 
     @callback
     @api_route("players/controls/:control_id")
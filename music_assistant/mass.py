@@ -18,6 +18,7 @@ from music_assistant.constants import (
 from music_assistant.helpers.cache import Cache
 from music_assistant.helpers.migration import check_migrations
 from music_assistant.helpers.util import callback, get_ip_pton, is_callback
+from music_assistant.helpers.web import json_serializer
 from music_assistant.managers.config import ConfigManager
 from music_assistant.managers.database import DatabaseManager
 from music_assistant.managers.library import LibraryManager
@@ -81,7 +82,18 @@ class MusicAssistant:
         # create shared aiohttp ClientSession
         self._http_session = aiohttp.ClientSession(
             loop=self.loop,
-            connector=aiohttp.TCPConnector(enable_cleanup_closed=True, ssl=False),
+            connector=aiohttp.TCPConnector(
+                limit=512,
+                # no per host limit: long lived audio streams to a single host
+                # would otherwise block all other requests to that host
+                limit_per_host=0,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True,
+                ssl=False,
+            ),
+            json_serialize=json_serializer,
+            # no total timeout as the session is also used for (endless) audio streams
+            timeout=aiohttp.ClientTimeout(total=None, connect=10, sock_read=60),
         )
         # run migrations if needed
         await check_migrations(self)
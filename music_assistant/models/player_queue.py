@@ -262,6 +262,13 @@ class PlayerQueue:
             return self.items[index]
         return None
 
+    @callback
+    def get_items(self, offset: int = 0, limit: int = 0) -> List[QueueItem]:
+        """Get (a page of) the items in the queue, starting at offset."""
+        if not limit:
+            return self._items[offset:]
+        return self._items[offset : offset + limit]
+
     @callback
     def by_item_id(self, queue_item_id: str) -> Optional[QueueItem]:
         """Get item by queue_item_id from queue."""
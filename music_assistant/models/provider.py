@@ -144,7 +144,10 @@ class MusicProvider(Provider):
         ]
 
     async def search(
-        self, search_query: str, media_types=Optional[List[MediaType]], limit: int = 5
+        self,
+        search_query: str,
+        media_types: Optional[List[MediaType]] = None,
+        limit: int = 5,
     ) -> SearchResult:
         """
         Perform search on musicprovider.
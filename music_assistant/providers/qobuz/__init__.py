@@ -34,6 +34,13 @@ PROV_ID = "qobuz"
 PROV_NAME = "Qobuz"
 LOGGER = logging.getLogger(PROV_ID)
 
+SEARCH_TYPES = {
+    MediaType.Artist: "artists",
+    MediaType.Album: "albums",
+    MediaType.Track: "tracks",
+    MediaType.Playlist: "playlists",
+}
+
 CONFIG_ENTRIES = [
     ConfigEntry(
         entry_key=CONF_USERNAME,
@@ -100,7 +107,10 @@ class QobuzProvider(MusicProvider):
         return True
 
     async def search(
-        self, search_query: str, media_types=Optional[List[MediaType]], limit: int = 5
+        self,
+        search_query: str,
+        media_types: Optional[List[MediaType]] = None,
+        limit: int = 5,
     ) -> SearchResult:
         """
         Perform search on musicprovider.
@@ -111,16 +121,9 @@ class QobuzProvider(MusicProvider):
         """
         result = SearchResult()
         params = {"query": search_query, "limit": limit}
-        if len(media_types) == 1:
+        if media_types and len(media_types) == 1 and media_types[0] in SEARCH_TYPES:
             # qobuz does not support multiple searchtypes, falls back to all if no type given
-            if media_types[0] == MediaType.Artist:
-                params["type"] = "artists"
-            if media_types[0] == MediaType.Album:
-                params["type"] = "albums"
-            if media_types[0] == MediaType.Track:
-                params["type"] = "tracks"
-            if media_types[0] == MediaType.Playlist:
-                params["type"] = "playlists"
+            params["type"] = SEARCH_TYPES[media_types[0]]
         searchresult = await self._get_data("catalog/search", params)
         if searchresult:
             if "artists" in searchresult:
@@ -33,6 +33,13 @@ PROV_NAME = "Spotify"
 
 LOGGER = logging.getLogger(PROV_ID)
 
+SEARCH_TYPES = {
+    MediaType.Artist: "artist",
+    MediaType.Album: "album",
+    MediaType.Track: "track",
+    MediaType.Playlist: "playlist",
+}
+
 CONFIG_ENTRIES = [
     ConfigEntry(
         entry_key=CONF_USERNAME,
@@ -109,7 +116,10 @@ class SpotifyProvider(MusicProvider):
         return token is not None
 
     async def search(
-        self, search_query: str, media_types=Optional[List[MediaType]], limit: int = 5
+        self,
+        search_query: str,
+        media_types: Optional[List[MediaType]] = None,
+        limit: int = 5,
     ) -> SearchResult:
         """
         Perform search on musicprovider.
@@ -119,16 +129,13 @@ class SpotifyProvider(MusicProvider):
             :param limit: Number of items to return in the search (per type).
         """
         result = SearchResult()
-        searchtypes = []
-        if MediaType.Artist in media_types:
-            searchtypes.append("artist")
-        if MediaType.Album in media_types:
-            searchtypes.append("album")
-        if MediaType.Track in media_types:
-            searchtypes.append("track")
-        if MediaType.Playlist in media_types:
-            searchtypes.append("playlist")
-        searchtype = ",".join(searchtypes)
+        if media_types is None:
+            media_types = SEARCH_TYPES.keys()
+        searchtype = ",".join(
+            SEARCH_TYPES[media_type]
+            for media_type in media_types
+            if media_type in SEARCH_TYPES
+        )
         params = {"q": search_query, "type": searchtype, "limit": limit}
         searchresult = await self._get_data("search", params=params)
         if searchresult:
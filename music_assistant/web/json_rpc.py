@@ -1,9 +1,127 @@
 """JSON RPC API endpoint (mostly) compatible with LMS."""
 
+from typing import Awaitable, Callable, List, Optional
+
 from aiohttp.web import Request, Response
+from music_assistant.helpers.typing import PlayerManager
+from music_assistant.helpers.util import try_parse_bool
 from music_assistant.helpers.web import require_local_subnet
 
 
+def _cmd_without_args(command: str) -> Callable:
+    """Return handler for a PlayerManager command that takes no arguments."""
+
+    def handler(
+        players: PlayerManager, player_id: str, cmds: List[str]
+    ) -> Optional[Awaitable]:
+        if len(cmds) > 1:
+            return None
+        return getattr(players, command)(player_id)
+
+    return handler
+
+
+def _cmd_pause(
+    players: PlayerManager, player_id: str, cmds: List[str]
+) -> Optional[Awaitable]:
+    """Handle pause command."""
+    if len(cmds) < 2:
+        return players.cmd_play_pause(player_id)
+    if cmds[1] == "1":
+        return players.cmd_pause(player_id)
+    if cmds[1] == "0":
+        return players.cmd_play(player_id)
+    return None
+
+
+def _cmd_power(players: PlayerManager, player_id: str, cmds: List[str]) -> Awaitable:
+    """Handle power command."""
+    if len(cmds) > 1 and try_parse_bool(cmds[1]):
+        return players.cmd_power_on(player_id)
+    return players.cmd_power_off(player_id)
+
+
+def _cmd_playlist_index(
+    players: PlayerManager, player_id: str, cmds: List[str]
+) -> Optional[Awaitable]:
+    """Handle playlist index command."""
+    if len(cmds) < 3:
+        return None
+    value = str(cmds[2])
+    if value.isdecimal():
+        # unsigned value is an absolute index
+        return players.play_index(player_id, int(value))
+    if value[:1] not in ("+", "-") or not value[1:].isdecimal():
+        return None
+    # signed value is a move relative to the current index
+    if value == "+1":
+        return players.cmd_next(player_id)
+    if value == "-1":
+        return players.cmd_previous(player_id)
+    player_queue = players.get_player_queue(player_id)
+    if not player_queue or player_queue.cur_index is None:
+        return None
+    return players.play_index(player_id, max(player_queue.cur_index + int(value), 0))
+
+
+def _cmd_mixer_volume(
+    players: PlayerManager, player_id: str, cmds: List[str]
+) -> Optional[Awaitable]:
+    """Handle mixer volume command."""
+    if len(cmds) < 3:
+        return None
+    if "+" in cmds[2]:
+        player = players.get_player(player_id)
+        volume_level = player.volume_level + int(cmds[2].split("+")[1])
+    elif "-" in cmds[2]:
+        player = players.get_player(player_id)
+        volume_level = player.volume_level - int(cmds[2].split("-")[1])
+    else:
+        volume_level = cmds[2]
+    return players.cmd_volume_set(player_id, volume_level)
+
+
+def _cmd_mixer_muting(
+    players: PlayerManager, player_id: str, cmds: List[str]
+) -> Optional[Awaitable]:
+    """Handle mixer muting command."""
+    if len(cmds) < 3:
+        return None
+    if cmds[2] == "toggle":
+        player = players.get_player(player_id)
+        if not player:
+            return None
+        return players.cmd_volume_mute(player_id, not player.muted)
+    if cmds[2] not in ("0", "1"):
+        return None
+    return players.cmd_volume_mute(player_id, cmds[2] == "1")
+
+
+# map (first two parts of the) LMS command to PlayerManager command,
+# single part commands receive (and validate) any further arguments themselves,
+# a handler returns None if the command arguments are not supported
+RPC_COMMANDS = {
+    ("play",): _cmd_without_args("cmd_play"),
+    ("pause",): _cmd_pause,
+    ("stop",): _cmd_without_args("cmd_stop"),
+    ("next",): _cmd_without_args("cmd_next"),
+    ("previous",): _cmd_without_args("cmd_previous"),
+    ("power",): _cmd_power,
+    ("playlist", "index"): _cmd_playlist_index,
+    ("mixer", "volume"): _cmd_mixer_volume,
+    ("mixer", "muting"): _cmd_mixer_muting,
+    ("button", "volup"): lambda players, player_id, cmds: players.cmd_volume_up(
+        player_id
+    ),
+    ("button", "voldown"): lambda players, player_id, cmds: players.cmd_volume_down(
+        player_id
+    ),
+    ("button", "power"): lambda players, player_id, cmds: players.cmd_power_toggle(
+        player_id
+    ),
+}
+
+
 @require_local_subnet
 async def json_rpc_endpoint(request: Request):
     """
@@ -12,52 +130,20 @@ async def json_rpc_endpoint(request: Request):
     for some compatability with tools that talk to LMS
     only support for basic commands
     """
-    # pylint: disable=too-many-branches
     data = await request.json()
-    params = data["params"]
+    params = data.get("params") if isinstance(data, dict) else None
+    if not isinstance(params, list) or len(params) < 2:
+        return Response(status=400, text="invalid params")
     player_id = params[0]
     cmds = params[1]
-    cmd_str = " ".join(cmds)
-    if cmd_str == "play":
-        await request.app["mass"].players.cmd_play(player_id)
-    elif cmd_str == "pause":
-        await request.app["mass"].players.cmd_pause(player_id)
-    elif cmd_str == "stop":
-        await request.app["mass"].players.cmd_stop(player_id)
-    elif cmd_str == "next":
-        await request.app["mass"].players.cmd_next(player_id)
-    elif cmd_str == "previous":
-        await request.app["mass"].players.cmd_previous(player_id)
-    elif "power" in cmd_str:
-        powered = cmds[1] if len(cmds) > 1 else False
-        if powered:
-            await request.app["mass"].players.cmd_power_on(player_id)
-        else:
-            await request.app["mass"].players.cmd_power_off(player_id)
-    elif cmd_str == "playlist index +1":
-        await request.app["mass"].players.cmd_next(player_id)
-    elif cmd_str == "playlist index -1":
-        await request.app["mass"].players.cmd_previous(player_id)
-    elif "mixer volume" in cmd_str and "+" in cmds[2]:
-        player = request.app["mass"].players.get_player(player_id)
-        volume_level = player.volume_level + int(cmds[2].split("+")[1])
-        await request.app["mass"].players.cmd_volume_set(player_id, volume_level)
-    elif "mixer volume" in cmd_str and "-" in cmds[2]:
-        player = request.app["mass"].players.get_player(player_id)
-        volume_level = player.volume_level - int(cmds[2].split("-")[1])
-        await request.app["mass"].players.cmd_volume_set(player_id, volume_level)
-    elif "mixer volume" in cmd_str:
-        await request.app["mass"].players.cmd_volume_set(player_id, cmds[2])
-    elif cmd_str == "mixer muting 1":
-        await request.app["mass"].players.cmd_volume_mute(player_id, True)
-    elif cmd_str == "mixer muting 0":
-        await request.app["mass"].players.cmd_volume_mute(player_id, False)
-    elif cmd_str == "button volup":
-        await request.app["mass"].players.cmd_volume_up(player_id)
-    elif cmd_str == "button voldown":
-        await request.app["mass"].players.cmd_volume_down(player_id)
-    elif cmd_str == "button power":
-        await request.app["mass"].players.cmd_power_toggle(player_id)
-    else:
+    if not isinstance(cmds, list) or not cmds:
+        return Response(status=400, text="invalid params")
+    key = tuple(cmds[:2])
+    handler = RPC_COMMANDS.get(key) or RPC_COMMANDS.get(key[:1])
+    if handler is None:
+        return Response(text="command not supported")
+    command = handler(request.app["mass"].players, player_id, cmds)
+    if command is None:
         return Response(text="command not supported")
+    await command
     return Response(text="success")
@@ -10,13 +10,14 @@ import asyncio
 import datetime
 import logging
 import os
+import re
 import uuid
 from base64 import b64encode
 from typing import Any, Awaitable, Optional, Union
 
 import aiohttp_cors
 import jwt
-import ujson
+import orjson
 from aiohttp import WSMsgType, web
 from aiohttp.web import WebSocketResponse
 from music_assistant.constants import (
@@ -29,8 +30,16 @@ from music_assistant.helpers import repath
 from music_assistant.helpers.encryption import decrypt_string
 from music_assistant.helpers.images import get_image_url, get_thumb_file
 from music_assistant.helpers.typing import MusicAssistant
-from music_assistant.helpers.util import get_hostname, get_ip
-from music_assistant.helpers.web import api_route, json_serializer, parse_arguments
+from music_assistant.helpers.util import callback, get_hostname, get_ip
+from music_assistant.helpers.web import (
+    api_route,
+    error_middleware,
+    json_response,
+    json_serializer,
+    mark_response_prepared,
+    parse_arguments,
+    precompress_static_files,
+)
 from music_assistant.models.media_types import ItemMapping, MediaItem
 
 from .json_rpc import json_rpc_endpoint
@@ -38,6 +47,19 @@ from .streams import routes as stream_routes
 
 LOGGER = logging.getLogger("webserver")
 
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STATIC_DIR = os.path.join(BASE_DIR, "web", "static")
+INDEX_FILE = os.path.join(STATIC_DIR, "index.html")
+PROVIDERS_DIR = os.path.join(BASE_DIR, "providers")
+
+# max number of pending event messages per websocket client
+WS_EVENTS_QUEUE_SIZE = 256
+# don't let open (stream) connections stall shutdown
+SHUTDOWN_TIMEOUT = 5
+
+# static files with a content hash in their name can be cached forever
+HASHED_FILE_RE = re.compile(r"\.[0-9a-f]{8,}\.(js|css)$")
+
 
 class WebServer:
     """Webserver and json/websocket api."""
@@ -53,18 +75,24 @@ class WebServer:
         self._ip_address = get_ip()
         self.config = mass.config.base["web"]
         self._runner = None
+        self._index_html = None
         self.api_routes = {}
 
     async def setup(self):
         """Perform async setup."""
         self.jwt_key = await decrypt_string(self.mass.config.stored_config["jwt_key"])
-        self.app = web.Application()
+        self.app = web.Application(middlewares=[error_middleware])
+        self.app.on_response_prepare.append(mark_response_prepared)
         self.app["mass"] = self.mass
         self.app["clients"] = []
         # add all routes
-        self.app.add_routes(stream_routes)
-        self.app.router.add_route("*", "/jsonrpc.js", json_rpc_endpoint)
-        self.app.router.add_get("/ws", self._websocket_handler)
+        self.app.add_routes(
+            [
+                *stream_routes,
+                web.route("*", "/jsonrpc.js", json_rpc_endpoint),
+                web.get("/ws", self._websocket_handler),
+            ]
+        )
 
         # register all methods decorated as api_route
         for cls in [
@@ -88,30 +116,47 @@ class WebServer:
         )
         cors.add(self.app.router.add_get("/info", self.info))
         # Host the frontend app
-        webdir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static/")
-        if os.path.isdir(webdir):
+        if os.path.isfile(INDEX_FILE):
+            with open(INDEX_FILE, "rb") as _file:
+                self._index_html = _file.read()
+            self.mass.add_job(precompress_static_files, STATIC_DIR)
             self.app.router.add_get("/", self.index)
-            self.app.router.add_static("/", webdir, append_version=True)
+            self.app.router.add_static("/", STATIC_DIR, append_version=True)
+            self.app.on_response_prepare.append(self._on_response_prepare)
         else:
             self.app.router.add_get("/", self.info)
 
         self._runner = web.AppRunner(self.app, access_log=None)
         await self._runner.setup()
         # set host to None to bind to all addresses on both IPv4 and IPv6
-        http_site = web.TCPSite(self._runner, host=None, port=self.port)
+        http_site = web.TCPSite(
+            self._runner,
+            host=None,
+            port=self.port,
+            shutdown_timeout=SHUTDOWN_TIMEOUT,
+        )
         await http_site.start()
         LOGGER.info("Started Music Assistant server on port %s", self.port)
         self.mass.add_event_listener(self._handle_mass_events)
 
     async def stop(self):
         """Stop the webserver."""
-        for ws_client in self.app["clients"]:
+        for ws_client in list(self.app["clients"]):
             await ws_client.close(message=b"server shutdown")
+        await self._runner.cleanup()
 
     def register_api_route(self, cmd: str, func: Awaitable):
-        """Register a command(handler) to the websocket api."""
-        pattern = repath.path_to_pattern(cmd)
-        self.api_routes[pattern] = func
+        """
+        Register a command(handler) to the websocket api.
+
+        Routes are grouped by the first part of their path,
+        which must be a fixed string (e.g. players/:player_id).
+        """
+        prefix = cmd.split("/", 1)[0]
+        if prefix.startswith(":"):
+            raise ValueError("First part of api route must be fixed: %s" % cmd)
+        pattern = re.compile(repath.path_to_pattern(cmd))
+        self.api_routes.setdefault(prefix, {})[pattern] = func
 
     def register_api_routes(self, cls: Any):
         """Register all methods of a class (instance) that are decorated with api_route."""
@@ -173,16 +218,25 @@ class WebServer:
     async def index(self, request: web.Request):
         """Get the index page."""
         # pylint: disable=unused-argument
-        html_app = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)), "static/index.html"
+        return web.Response(
+            body=self._index_html,
+            content_type="text/html",
+            headers={"Cache-Control": "no-cache"},
         )
-        return web.FileResponse(html_app)
+
+    @staticmethod
+    async def _on_response_prepare(request: web.Request, response: web.StreamResponse):
+        """Set cache headers on static files of the frontend app."""
+        if isinstance(response, web.FileResponse) and HASHED_FILE_RE.search(
+            request.path
+        ):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
 
     @api_route("info", False)
     async def info(self, request: web.Request = None):
         """Return discovery info on index page."""
         if request:
-            return web.json_response(self.discovery_info)
+            return json_response(self.discovery_info)
         return self.discovery_info
 
     @api_route("revoke_token")
@@ -265,8 +319,7 @@ class WebServer:
                 prov.id: await self.get_provider_icon(prov.id)
                 for prov in self.mass.get_providers(include_unavailable=True)
             }
-        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        icon_path = os.path.join(base_dir, "providers", provider_id, "icon.png")
+        icon_path = os.path.join(PROVIDERS_DIR, provider_id, "icon.png")
         if os.path.isfile(icon_path):
             with open(icon_path, "rb") as _file:
                 icon_data = _file.read()
@@ -277,49 +330,58 @@ class WebServer:
     async def _websocket_handler(self, request: web.Request):
         """Handle websocket client."""
 
-        ws_client = WebSocketResponse()
+        # heartbeat detects (and closes) dead connections
+        ws_client = WebSocketResponse(heartbeat=30)
         ws_client.authenticated = False
+        # events are queued per client and sent by a background task,
+        # so a slow client can not hold up the broadcast to other clients
+        ws_client.events = asyncio.Queue(maxsize=WS_EVENTS_QUEUE_SIZE)
         await ws_client.prepare(request)
         request.app["clients"].append(ws_client)
+        sender_task = self.mass.loop.create_task(self._send_events(ws_client))
 
         # handle incoming messages
-        async for msg in ws_client:
-            try:
-                if msg.type == WSMsgType.error:
-                    LOGGER.warning(
-                        "ws connection closed with exception %s", ws_client.exception()
-                    )
-                if msg.type != WSMsgType.text:
-                    continue
-                if msg.data == "close":
-                    await ws_client.close()
-                    break
-                # regular message
-                json_msg = msg.json(loads=ujson.loads)
-                if "command" in json_msg and "data" in json_msg:
-                    # handle command
-                    await self._handle_command(
-                        ws_client,
-                        json_msg["command"],
-                        json_msg["data"],
-                        json_msg.get("id"),
-                    )
-                elif "event" in json_msg:
-                    # handle event
-                    await self._handle_event(
-                        ws_client, json_msg["event"], json_msg.get("data")
-                    )
-            except AuthenticationError as exc:  # pylint:disable=broad-except
-                # disconnect client on auth errors
-                await self._send_json(ws_client, error=str(exc), **json_msg)
-                await ws_client.close(message=str(exc).encode())
-            except Exception as exc:  # pylint:disable=broad-except
-                # log the error only
-                await self._send_json(ws_client, error=str(exc), **json_msg)
-                LOGGER.error("Error with WS client", exc_info=exc)
-
-        # websocket disconnected
-        request.app["clients"].remove(ws_client)
+        try:
+            async for msg in ws_client:
+                try:
+                    if msg.type == WSMsgType.error:
+                        LOGGER.warning(
+                            "ws connection closed with exception %s",
+                            ws_client.exception(),
+                        )
+                    if msg.type != WSMsgType.text:
+                        continue
+                    if msg.data == "close":
+                        await ws_client.close()
+                        break
+                    # regular message
+                    json_msg = msg.json(loads=orjson.loads)
+                    if "command" in json_msg and "data" in json_msg:
+                        # handle command
+                        await self._handle_command(
+                            ws_client,
+                            json_msg["command"],
+                            json_msg["data"],
+                            json_msg.get("id"),
+                        )
+                    elif "event" in json_msg:
+                        # handle event
+                        await self._handle_event(
+                            ws_client, json_msg["event"], json_msg.get("data")
+                        )
+                except AuthenticationError as exc:  # pylint:disable=broad-except
+                    # disconnect client on auth errors
+                    await self._send_json(ws_client, error=str(exc), **json_msg)
+                    await ws_client.close(message=str(exc).encode())
+                except Exception as exc:  # pylint:disable=broad-except
+                    # log the error only
+                    await self._send_json(ws_client, error=str(exc), **json_msg)
+                    LOGGER.error("Error with WS client", exc_info=exc)
+        finally:
+            # websocket disconnected (or the handler got cancelled)
+            sender_task.cancel()
+            self._remove_client(ws_client)
+
         LOGGER.debug("websocket connection closed: %s", request.remote)
 
         return ws_client
@@ -336,11 +398,11 @@ class WebServer:
         if command == "auth":
             return await self._handle_auth(ws_client, data)
         # work out handler for the given path/command
-        for key in self.api_routes:
-            match = repath.match_pattern(key, command)
+        api_routes = self.api_routes.get(command.split("/", 1)[0], {})
+        for pattern, handler in api_routes.items():
+            match = pattern.match(command)
             if match:
                 params = match.groupdict()
-                handler = self.api_routes[key]
                 # check authentication
                 if (
                     getattr(handler, "ws_require_auth", True)
@@ -379,20 +441,40 @@ class WebServer:
         """Send message (back) to websocket client."""
         await ws_client.send_str(json_serializer(kwargs))
 
-    async def _handle_mass_events(self, event: str, event_data: Any):
-        """Broadcast events to connected clients."""
-        for ws_client in self.app["clients"]:
-            if not ws_client.authenticated:
-                continue
+    async def _send_events(self, ws_client: WebSocketResponse):
+        """Send queued event messages to websocket client."""
+        while not ws_client.closed:
+            msg = await ws_client.events.get()
             try:
-                await self._send_json(ws_client, event=event, data=event_data)
+                await ws_client.send_str(msg)
             except ConnectionResetError:
                 # client is already disconnected
-                self.app["clients"].remove(ws_client)
+                self._remove_client(ws_client)
+                return
             except Exception as exc:  # pylint: disable=broad-except
-                # log errors and continue sending to all other clients
+                # log errors and continue with the next message
                 LOGGER.debug("Error while sending message to api client", exc_info=exc)
 
+    @callback
+    def _remove_client(self, ws_client: WebSocketResponse):
+        """Remove websocket client from the list of connected clients."""
+        if ws_client in self.app["clients"]:
+            self.app["clients"].remove(ws_client)
+
+    @callback
+    def _handle_mass_events(self, event: str, event_data: Any):
+        """Broadcast events to connected clients."""
+        ws_clients = [x for x in self.app["clients"] if x.authenticated]
+        if not ws_clients:
+            return
+        # serialize the message only once for all clients
+        msg = json_serializer({"event": event, "data": event_data})
+        for ws_client in ws_clients:
+            try:
+                ws_client.events.put_nowait(msg)
+            except asyncio.QueueFull:
+                LOGGER.debug("Dropped event %s for slow api client", event)
+
 
 class AuthenticationError(Exception):
     """Custom Exception for all authentication errors."""
@@ -14,7 +14,7 @@ async def stream_media(request: Request):
     if media_type not in [MediaType.Track, MediaType.Radio]:
         return Response(status=404, reason="Media item is not playable!")
     item_id = request.match_info["item_id"]
-    provider = request.rel_url.query.get("provider", "database")
+    provider = request.query.get("provider", "database")
     media_item = await request.app["mass"].music.get_item(item_id, provider, media_type)
     streamdetails = await request.app["mass"].music.get_stream_details(media_item)
 
@@ -80,7 +80,7 @@ async def stream_group(request: Request):
     group_player_id = request.match_info["group_player_id"]
     if not request.app["mass"].players.get_player_queue(group_player_id):
         return Response(text="invalid player id", status=404)
-    child_player_id = request.rel_url.query.get("player_id", request.remote)
+    child_player_id = request.query.get("player_id", request.remote)
 
     # prepare request
     resp = StreamResponse(